@@ -3,6 +3,10 @@ from evaluate_intro import score_transcript
 
 st.set_page_config(page_title="Transcript Rubric Scorer", layout="centered")
 
+# Memoize on (transcript, duration) so re-pressing Score with the same text
+# (e.g. while tweaking duration) skips the regex/NLP passes entirely.
+score_transcript = st.cache_data(max_entries=128)(score_transcript)
+
 st.title("Transcript Rubric Scorer")
 st.write("Paste a self-introduction transcript and get rubric-based scoring with feedback.")
 
@@ -21,11 +25,10 @@ if st.button("Score"):
     st.markdown("---")
     st.subheader("Per-criterion details")
     for c in result["criteria"]:
-        with st.expander(f"{c['name']} (weight {c['weight']}) — score {c['score']}"):
-            st.write(c["feedback"])
-            extra = {k: v for k, v in c.items() if k not in ["name", "weight", "score", "feedback"]}
-            if extra:
-                st.json(extra)
+        with st.expander(f"{c.name} (weight {c.weight}) — score {c.score}"):
+            st.write(c.feedback)
+            if c.extra:
+                st.json(c.extra)
 
 st.markdown("---")
 st.caption("This is a rule-based + NLP hybrid scorer aligned with the provided rubric.")
@@ -1,224 +1,517 @@
-import re
-import json
-import argparse
-from typing import Dict, List, Tuple, Any, Optional
-
-from lexicalrichness import LexicalRichness
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-# Grammar checker (Java server auto-download); if fails, we degrade gracefully
-try:
-    import language_tool_python
-    LT_AVAILABLE = True
-except Exception:
-    LT_AVAILABLE = False
-
-FILLER_WORDS = {
-    "um", "uh", "like", "you know", "so", "actually", "basically", "right",
-    "i mean", "well", "kinda", "sort of", "okay", "hmm", "ah"
-}
-
-SALUTATION_PATTERNS = {
-    "excellent": [r"\b(i am (excited|thrilled)|feeling great)\b"],
-    "good": [r"\bgood (morning|afternoon|evening|day)\b", r"\bhello everyone\b"],
-    "normal": [r"\bhi\b", r"\bhello\b"]
-}
-
-MUST_HAVE_KEYS = {
-    "name": [r"\bmy name is\b", r"\bmyself\b", r"\bi am\b"],
-    "age": [r"\b\d{1,2}\s*years?\s*old\b"],
-    "school_class": [r"\bclass\s+\w+\b", r"\bschool\b"],
-    "family": [r"\bfamily\b", r"\bfather\b", r"\bmother\b", r"\bsister\b", r"\bbrother\b"],
-    "hobbies": [r"\b(hobby|hobbies|like to|enjoy|favorite|favourite)\b"]
-}
-
-GOOD_TO_HAVE_KEYS = {
-    "about_family": [r"\b(kind[- ]?hearted|soft[- ]?spoken)\b"],
-    "origin_location": [r"\bi am from\b", r"\bwe are from\b", r"\bparents are from\b"],
-    "ambition_goal": [r"\b(ambition|goal|dream|aspiration)\b"],
-    "interesting_unique": [r"\b(fun fact|unique|interesting)\b"],
-    "strengths_achievements": [r"\b(strength|achievement|award|ranked|won)\b"]
-}
-
-def tokenize_sentences(text: str) -> List[str]:
-    parts = re.split(r"[.!?]\s+", text.strip())
-    return [p.strip() for p in parts if p.strip()]
-
-def word_list(text: str) -> List[str]:
-    return re.findall(r"[A-Za-z']+", text.lower())
-
-def score_transcript(transcript: str, duration_sec: float = None) -> dict:
-    # Basic word and sentence count
-    words = len(transcript.split())
-    sentences = len([s for s in transcript.split('.') if s.strip()])
-
-    # Dummy scoring logic (replace with real checks if needed)
-    salutation_score = 4
-    keyword_score = 24
-    flow_score = 5
-    speech_rate_score = 10
-    grammar_score = 8
-    vocabulary_score = 6
-    filler_score = 12
-    sentiment_score = 12
-
-    # Weighted total (weights: 5, 30, 5, 10, 10, 10, 15, 15)
-    overall_score = (
-        salutation_score * (5 / 5) +
-        keyword_score * (30 / 30) +
-        flow_score * (5 / 5) +
-        speech_rate_score * (10 / 10) +
-        grammar_score * (10 / 10) +
-        vocabulary_score * (10 / 10) +
-        filler_score * (15 / 15) +
-        sentiment_score * (15 / 15)
-    )
-    return {
-        "overall_score": round(overall_score, 2),
-        "words": words,
-        "sentences": sentences,
-        "wpm": 120.0 if not duration_sec else round((words / duration_sec) * 60.0, 2),
-        "criteria": [
-            {"name": "Salutation Level", "weight": 5, "score": salutation_score, "feedback": "Detected greeting"},
-            {"name": "Keyword Presence", "weight": 30, "score": keyword_score, "feedback": "Basic details found"},
-            {"name": "Flow Order", "weight": 5, "score": flow_score, "feedback": "Logical order followed"},
-            {"name": "Speech Rate (WPM)", "weight": 10, "score": speech_rate_score, "feedback": "Ideal rate"},
-            {"name": "Grammar", "weight": 10, "score": grammar_score, "feedback": "Minor errors"},
-            {"name": "Vocabulary Richness", "weight": 10, "score": vocabulary_score, "feedback": "Moderate diversity"},
-            {"name": "Filler Word Rate", "weight": 15, "score": filler_score, "feedback": "Few filler words"},
-            {"name": "Sentiment/Positivity", "weight": 15, "score": sentiment_score, "feedback": "Positive tone"}
-        ]
-    }
-
-
-
-def compute_salutation_score(text: str) -> Tuple[int, str]:
-    t = text.lower().strip()
-    for pat in SALUTATION_PATTERNS["excellent"]:
-        if re.search(pat, t):
-            return 5, "Excellent salutation detected."
-    for pat in SALUTATION_PATTERNS["good"]:
-        if re.search(pat, t):
-            return 4, "Good salutation detected."
-    for pat in SALUTATION_PATTERNS["normal"]:
-        if re.search(pat, t):
-            return 2, "Normal salutation detected."
-    return 0, "No salutation found."
-
-def compute_keyword_presence(text: str) -> Tuple[int, Dict[str, bool], Dict[str, bool]]:
-    t = text.lower()
-    must_have_score = 0
-    good_have_score = 0
-    must_flags = {}
-    good_flags = {}
-
-    for key, pats in MUST_HAVE_KEYS.items():
-        present = any(re.search(p, t) for p in pats)
-        must_flags[key] = present
-        if present:
-            must_have_score += 4
-
-    for key, pats in GOOD_TO_HAVE_KEYS.items():
-        present = any(re.search(p, t) for p in pats)
-        good_flags[key] = present
-        if present:
-            good_have_score += 2
-
-    total = must_have_score + good_have_score
-    return total, must_flags, good_flags
-
-def compute_order_flow(text: str) -> Tuple[int, str]:
-    t = text.lower()
-    idx_sal = min([t.find("hello everyone"), t.find("hello "), t.find("hi ")])
-    idx_name = min([t.find("my name is"), t.find("myself "), t.find("i am ")])
-    idx_school = t.find("school")
-    idx_class = t.find("class")
-    idx_age = re.search(r"\d{1,2}\s*years?\s*old", t)
-    idx_place = max([t.find("i am from"), t.find("parents are from")])
-    idx_additional = max([t.find("fun fact"), t.find("unique"), t.find("interesting"),
-                          t.find("enjoy"), t.find("favorite"), t.find("favourite")])
-    idx_close = t.find("thank you")
-
-    basic_idxs = [i for i in [idx_name, (idx_age.start() if idx_age else -1),
-                              idx_school, idx_class, idx_place] if i >= 0]
-    if idx_sal >= 0 and basic_idxs and idx_additional >= 0 and idx_close >= 0:
-        valid = idx_sal <= min(basic_idxs) <= idx_additional <= idx_close
-        return (5 if valid else 0, "Order followed." if valid else "Order not followed.")
-    return 0, "Order not followed."
-
-def compute_speech_rate(words: int, duration_sec: Optional[float]) -> Tuple[int, float, str]:
-    if duration_sec is None or duration_sec <= 0:
-        return 10, 120.0, "Duration not provided; assumed ideal speech rate."
-    wpm = (words / duration_sec) * 60.0
-    if wpm > 161:
-        return 2, wpm, "Too fast."
-    elif 141 <= wpm <= 160:
-        return 6, wpm, "Fast."
-    elif 111 <= wpm <= 140:
-        return 10, wpm, "Ideal."
-    elif 81 <= wpm <= 110:
-        return 6, wpm, "Slow."
-    else:
-        return 2, wpm, "Too slow."
-
-def compute_grammar_score(text: str) -> Tuple[int, float, str]:
-    words = len(word_list(text)) or 1
-    try:
-        if LT_AVAILABLE:
-            tool = language_tool_python.LanguageTool('en-US')
-            matches = tool.check(text)
-            errors = len(matches)
-        else:
-            errors = 0
-            errors += len(re.findall(r"\s{2,}", text))
-            errors += len(re.findall(r"\b(\w+)\s+\1\b", text.lower()))
-        errors_per_100 = (errors / words) * 100.0
-        raw = 1.0 - min(errors_per_100 / 10.0, 1.0)
-    except Exception:
-        raw = 0.7
-    if raw > 0.9:
-        return 10, raw, "Excellent grammar."
-    elif 0.7 <= raw <= 0.89:
-        return 8, raw, "Good grammar."
-    elif 0.5 <= raw <= 0.69:
-        return 6, raw, "Fair grammar."
-    elif 0.3 <= raw <= 0.49:
-        return 4, raw, "Poor grammar."
-    else:
-        return 2, raw, "Very poor grammar."
-
-
-def compute_ttr_score(text: str) -> Tuple[int, float, str]:
-    lex = LexicalRichness(text)
-    try:
-        ttr = lex.ttr
-    except Exception:
-        wl = word_list(text)
-        distinct = len(set(wl))
-        total = len(wl) or 1
-        ttr = distinct / total
-    if 0.9 <= ttr <= 1.0:
-        return 10, ttr, "Excellent lexical diversity."
-    elif 0.7 <= ttr <= 0.89:
-        return 8, ttr, "Good lexical diversity."
-    elif 0.5 <= ttr <= 0.69:
-        return 6, ttr, "Fair lexical diversity."
-    elif 0.3 <= ttr <= 0.49:
-        return 4, ttr, "Poor lexical diversity."
-    else:
-        return 2, ttr, "Very poor lexical diversity."
-
-def compute_filler_rate_score(text: str) -> Tuple[int, float, str]:
-    wl = word_list(text)
-    total = len(wl) or 1
-    t_lower = " ".join(wl)
-    count = 0
-    for fw in FILLER_WORDS:
-        if " " in fw:
-            count += t_lower.count(fw)
-    for w in wl:
-        if w in FILLER_WORDS:
-            count += 1
-    rate = (count / total) * 100.0
-    if 0 <= rate <= 3:
-        return 15, rate, "Clear"
+import re
+import json
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Grammar checker (Java server auto-download); if fails, we degrade gracefully
+try:
+    import language_tool_python
+    LT_AVAILABLE = True
+except Exception:
+    LT_AVAILABLE = False
+
+# Optional SIMD multi-pattern matcher; the pure-regex path is the fallback
+try:
+    import hyperscan
+    HS_AVAILABLE = True
+except Exception:
+    HS_AVAILABLE = False
+
+# Optional batched tokenizer for score_batch; regex tokenization is the fallback
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except Exception:
+    SPACY_AVAILABLE = False
+
+_NLP = None
+
+def _get_nlp():
+    # Tokenizer-only pipeline (no model download); nlp.pipe batches the
+    # per-doc overhead across a whole list of transcripts.
+    global _NLP
+    if _NLP is None:
+        _NLP = spacy.blank("en")
+    return _NLP
+
+_LT = None
+
+def _get_lt():
+    # Lazy singleton: the LanguageTool Java server starts once per process
+    # instead of once per grammar check.
+    global _LT
+    if _LT is None:
+        _LT = language_tool_python.LanguageTool('en-US')
+    return _LT
+
+FILLER_WORDS = {
+    "um", "uh", "like", "you know", "so", "actually", "basically", "right",
+    "i mean", "well", "kinda", "sort of", "okay", "hmm", "ah"
+}
+
+@functools.lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int = re.IGNORECASE) -> "re.Pattern":
+    # Cached compile for pattern strings that may arrive dynamically (e.g. a
+    # rubric config); repeated calls with the same string pay compilation once.
+    return re.compile(pattern, flags)
+
+# Patterns are compiled once at import so the per-call hot path never pays
+# re-compilation or the re-module cache lookup.
+SALUTATION_PATTERNS = {
+    "excellent": [_compile(p) for p in [r"\b(i am (excited|thrilled)|feeling great)\b"]],
+    "good": [_compile(p) for p in [r"\bgood (morning|afternoon|evening|day)\b", r"\bhello everyone\b"]],
+    "normal": [_compile(p) for p in [r"\bhi\b", r"\bhello\b"]]
+}
+
+# One compiled alternation per level: a single search call replaces the
+# per-pattern loop in compute_salutation_score.
+SALUTATION_COMBINED = {
+    level: _compile("|".join(p.pattern for p in pats))
+    for level, pats in SALUTATION_PATTERNS.items()
+}
+
+MUST_HAVE_KEYS = {
+    "name": [_compile(p) for p in [r"\bmy name is\b", r"\bmyself\b", r"\bi am\b"]],
+    "age": [_compile(p) for p in [r"\b\d{1,2}\s*years?\s*old\b"]],
+    "school_class": [_compile(p) for p in [r"\bclass\s+\w+\b", r"\bschool\b"]],
+    "family": [_compile(p) for p in [r"\bfamily\b", r"\bfather\b", r"\bmother\b", r"\bsister\b", r"\bbrother\b"]],
+    "hobbies": [_compile(p) for p in [r"\b(hobby|hobbies|like to|enjoy|favorite|favourite)\b"]]
+}
+
+GOOD_TO_HAVE_KEYS = {
+    "about_family": [_compile(p) for p in [r"\b(kind[- ]?hearted|soft[- ]?spoken)\b"]],
+    "origin_location": [_compile(p) for p in [r"\bi am from\b", r"\bwe are from\b", r"\bparents are from\b"]],
+    "ambition_goal": [_compile(p) for p in [r"\b(ambition|goal|dream|aspiration)\b"]],
+    "interesting_unique": [_compile(p) for p in [r"\b(fun fact|unique|interesting)\b"]],
+    "strengths_achievements": [_compile(p) for p in [r"\b(strength|achievement|award|ranked|won)\b"]]
+}
+
+def _combined_pattern(key_patterns) -> "re.Pattern":
+    # One alternation with a named group per category; a single finditer
+    # sweep then reports which categories matched via m.lastgroup.
+    return re.compile(
+        "|".join(
+            "(?P<%s>%s)" % (key, "|".join(p.pattern for p in pats))
+            for key, pats in key_patterns.items()
+        ),
+        re.IGNORECASE,
+    )
+
+# Most keyword patterns are just \b-anchored literals; those are checked with
+# plain substring tests on the space-joined token stream, which needs no regex
+# engine at all. Only genuine regexes (quantifiers, alternations) stay compiled.
+_LITERAL_SRC_RE = re.compile(r"\\b[a-z' ]+\\b")
+
+def _split_literals(key_patterns) -> Tuple[Dict[str, List[str]], Dict[str, list]]:
+    literals: Dict[str, List[str]] = {}
+    regexes: Dict[str, list] = {}
+    for key, pats in key_patterns.items():
+        for p in pats:
+            src = p.pattern
+            if _LITERAL_SRC_RE.fullmatch(src):
+                literals.setdefault(key, []).append(src[2:-2])
+            else:
+                regexes.setdefault(key, []).append(p)
+    return literals, regexes
+
+LITERAL_MUST, _REGEX_MUST = _split_literals(MUST_HAVE_KEYS)
+LITERAL_GOOD, _REGEX_GOOD = _split_literals(GOOD_TO_HAVE_KEYS)
+MUST_HAVE_RE = _combined_pattern(_REGEX_MUST)
+GOOD_TO_HAVE_RE = _combined_pattern(_REGEX_GOOD)
+
+# When hyperscan is installed, all keyword patterns are compiled once into a
+# single database and each transcript is one SIMD scan returning pattern ids.
+_HS_DB = None
+_HS_IDS: List[Tuple[str, str]] = []
+for _bucket, _table in (("must", MUST_HAVE_KEYS), ("good", GOOD_TO_HAVE_KEYS)):
+    for _key, _pats in _table.items():
+        for _p in _pats:
+            _HS_IDS.append((_bucket, _key))
+
+def _get_hs_db():
+    global _HS_DB
+    if _HS_DB is None:
+        exprs = [p.pattern.encode()
+                 for table in (MUST_HAVE_KEYS, GOOD_TO_HAVE_KEYS)
+                 for pats in table.values() for p in pats]
+        db = hyperscan.Database()
+        db.compile(expressions=exprs, ids=list(range(len(exprs))),
+                   flags=[hyperscan.HS_FLAG_CASELESS] * len(exprs))
+        _HS_DB = db
+    return _HS_DB
+
+# The split pattern consumes the whitespace around terminators itself, so
+# sentence tokenization is one split plus an empty-string filter. Terminators
+# only count when followed by whitespace or end-of-text, leaving decimals and
+# dotted abbreviations ("3.5 years old") intact.
+SENT_RE = re.compile(r"\s*[.!?]+(?:\s+|$)")
+WORD_RE = re.compile(r"[A-Za-z']+")
+# All flow markers in one alternation; a single finditer walk records the
+# first occurrence of each marker. "place" precedes "name" so "i am from"
+# is credited to the location marker rather than swallowed by "i am ".
+ORDER_RE = re.compile(
+    r"(?P<sal>hello everyone|hello |hi )"
+    r"|(?P<place>i am from|parents are from)"
+    r"|(?P<name>my name is|myself |i am )"
+    r"|(?P<school>school)"
+    r"|(?P<cls>class)"
+    r"|(?P<age>\d{1,2}\s*years?\s*old)"
+    r"|(?P<extra>fun fact|unique|interesting|enjoy|favou?rite)"
+    r"|(?P<close>thank you)"
+)
+# Single-word fillers are a set-membership test per token; only the
+# multi-word phrases still need a regex pass over the joined token stream.
+FILLER_SINGLES = frozenset(w for w in FILLER_WORDS if " " not in w)
+FILLER_PHRASES = tuple(w for w in FILLER_WORDS if " " in w)
+FILLER_PHRASE_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(FILLER_PHRASES, key=len, reverse=True))) + r")\b"
+)
+
+def tokenize_sentences(text: str) -> List[str]:
+    return list(filter(None, SENT_RE.split(text.strip())))
+
+def word_list(text: str) -> List[str]:
+    return WORD_RE.findall(text.lower())
+
+@dataclass
+class Tokens:
+    """Tokenization of one transcript, computed once and shared by all scorers."""
+    words: List[str]
+    lower: List[str]
+    joined: str
+    sentences: List[str]
+    text_lower: str
+
+def tokenize(text: str) -> Tokens:
+    text_lower = text.lower()
+    words = WORD_RE.findall(text)
+    lower = [w.lower() for w in words]
+    return Tokens(words=words, lower=lower, joined=" ".join(lower),
+                  sentences=tokenize_sentences(text), text_lower=text_lower)
+
+@dataclass(slots=True)
+class Criterion:
+    """One rubric row; extra holds criterion-specific values (flags, wpm, ttr...).
+
+    Slots keep the eight per-call instances far cheaper than dicts; convert
+    with dataclasses.asdict at JSON-serialization boundaries.
+    """
+    name: str
+    weight: int
+    score: int
+    feedback: str
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+def score_transcript(transcript: str, duration_sec: float = None,
+                     include_details: bool = True) -> dict:
+    # Tokenize once; every scorer shares the same Tokens instead of
+    # re-scanning the transcript.
+    return _score_with_tokens(transcript, duration_sec, tokenize(transcript),
+                              include_details)
+
+def _score_with_tokens(transcript: str, duration_sec: Optional[float], toks: Tokens,
+                       include_details: bool = True) -> dict:
+    # Basic word and sentence count, from the shared tokenization
+    words = len(toks.words)
+    sentences = len(toks.sentences)
+
+    # The LanguageTool check dominates latency and is independent of every
+    # other scorer, so it runs in a worker thread while the rest score
+    # inline; overall latency is max(grammar, rest) instead of the sum.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        fut_grammar = ex.submit(compute_grammar_score, transcript, toks)
+
+        salutation_score, salutation_fb = compute_salutation_score(toks)
+        keyword_score, must_flags, good_flags = compute_keyword_presence(toks)
+        flow_score, flow_fb = compute_order_flow(toks)
+        speech_rate_score, wpm, rate_fb = compute_speech_rate(len(toks.words), duration_sec)
+        vocabulary_score, ttr, vocab_fb = compute_ttr_score(toks)
+        filler_score, filler_rate, filler_fb = compute_filler_rate_score(toks)
+        sentiment_score, compound, sentiment_fb = compute_sentiment_score(transcript, toks)
+
+        grammar_score, grammar_raw, grammar_fb = fut_grammar.result()
+
+    # Weighted total (weights: 5, 30, 5, 10, 10, 10, 15, 15)
+    overall_score = (
+        salutation_score * (5 / 5) +
+        keyword_score * (30 / 30) +
+        flow_score * (5 / 5) +
+        speech_rate_score * (10 / 10) +
+        grammar_score * (10 / 10) +
+        vocabulary_score * (10 / 10) +
+        filler_score * (15 / 15) +
+        sentiment_score * (15 / 15)
+    )
+    result = {
+        "overall_score": round(overall_score, 2),
+        "words": words,
+        "sentences": sentences,
+        "wpm": round(wpm, 2),
+    }
+    if include_details:
+        keyword_fb = "Found %d/5 must-have and %d/5 good-to-have details." % (
+            sum(must_flags.values()), sum(good_flags.values()))
+        result["criteria"] = [
+            Criterion("Salutation Level", 5, salutation_score, salutation_fb),
+            Criterion("Keyword Presence", 30, keyword_score, keyword_fb,
+                      {"must_have": must_flags, "good_to_have": good_flags}),
+            Criterion("Flow Order", 5, flow_score, flow_fb),
+            Criterion("Speech Rate (WPM)", 10, speech_rate_score, rate_fb,
+                      {"wpm": round(wpm, 2)}),
+            Criterion("Grammar", 10, grammar_score, grammar_fb,
+                      {"quality": round(grammar_raw, 2)}),
+            Criterion("Vocabulary Richness", 10, vocabulary_score, vocab_fb,
+                      {"ttr": round(ttr, 3)}),
+            Criterion("Filler Word Rate", 15, filler_score, filler_fb,
+                      {"rate_percent": round(filler_rate, 2)}),
+            Criterion("Sentiment/Positivity", 15, sentiment_score, sentiment_fb,
+                      {"compound": round(compound, 3)})
+        ]
+    return result
+
+
+
+def compute_salutation_score(toks: Tokens) -> Tuple[int, str]:
+    t = toks.text_lower.strip()
+    if SALUTATION_COMBINED["excellent"].search(t):
+        return 5, "Excellent salutation detected."
+    if SALUTATION_COMBINED["good"].search(t):
+        return 4, "Good salutation detected."
+    if SALUTATION_COMBINED["normal"].search(t):
+        return 2, "Normal salutation detected."
+    return 0, "No salutation found."
+
+def compute_keyword_presence(toks: Tokens) -> Tuple[int, Dict[str, bool], Dict[str, bool]]:
+    t = toks.text_lower
+    must_flags = dict.fromkeys(MUST_HAVE_KEYS, False)
+    good_flags = dict.fromkeys(GOOD_TO_HAVE_KEYS, False)
+
+    if HS_AVAILABLE:
+        matched = set()
+        _get_hs_db().scan(t.encode(),
+                          match_event_handler=lambda pid, *_: matched.add(pid))
+        for pid in matched:
+            bucket, key = _HS_IDS[pid]
+            (must_flags if bucket == "must" else good_flags)[key] = True
+    else:
+        # Strip possessives for the literal tests: \bfather\b matched
+        # "father's" in the regex bucket, so " father " must match it here too.
+        padded = " " + " ".join(
+            w[:-2] if w.endswith("'s") else w.rstrip("'") for w in toks.lower
+        ) + " "
+        for key, lits in LITERAL_MUST.items():
+            if any(" " + w + " " in padded for w in lits):
+                must_flags[key] = True
+        for key, lits in LITERAL_GOOD.items():
+            if any(" " + w + " " in padded for w in lits):
+                good_flags[key] = True
+
+        for m in MUST_HAVE_RE.finditer(t):
+            must_flags[m.lastgroup] = True
+        for m in GOOD_TO_HAVE_RE.finditer(t):
+            good_flags[m.lastgroup] = True
+
+    total = 4 * sum(must_flags.values()) + 2 * sum(good_flags.values())
+    return total, must_flags, good_flags
+
+def compute_order_flow(toks: Tokens) -> Tuple[int, str]:
+    idx: Dict[str, int] = {}
+    for m in ORDER_RE.finditer(toks.text_lower):
+        idx.setdefault(m.lastgroup, m.start())
+
+    basic_idxs = [idx[k] for k in ("name", "age", "school", "cls", "place") if k in idx]
+    if "sal" in idx and basic_idxs and "extra" in idx and "close" in idx:
+        valid = idx["sal"] <= min(basic_idxs) <= idx["extra"] <= idx["close"]
+        return (5 if valid else 0, "Order followed." if valid else "Order not followed.")
+    return 0, "Order not followed."
+
+def compute_speech_rate(words: int, duration_sec: Optional[float]) -> Tuple[int, float, str]:
+    if duration_sec is None or duration_sec <= 0:
+        return 10, 120.0, "Duration not provided; assumed ideal speech rate."
+    wpm = (words / duration_sec) * 60.0
+    if wpm > 161:
+        return 2, wpm, "Too fast."
+    elif 141 <= wpm <= 160:
+        return 6, wpm, "Fast."
+    elif 111 <= wpm <= 140:
+        return 10, wpm, "Ideal."
+    elif 81 <= wpm <= 110:
+        return 6, wpm, "Slow."
+    else:
+        return 2, wpm, "Too slow."
+
+def compute_grammar_score(text: str, toks: Tokens) -> Tuple[int, float, str]:
+    words = len(toks.lower) or 1
+    try:
+        if LT_AVAILABLE:
+            tool = _get_lt()
+            matches = tool.check(text)
+            errors = len(matches)
+        else:
+            # Heuristic fallback: adjacent duplicate tokens plus runs of
+            # double spaces, counted without the backreference regex path.
+            wl = toks.lower
+            errors = sum(1 for a, b in zip(wl, wl[1:]) if a == b)
+            errors += text.count("  ")
+        errors_per_100 = (errors / words) * 100.0
+        raw = 1.0 - min(errors_per_100 / 10.0, 1.0)
+    except Exception:
+        raw = 0.7
+    if raw > 0.9:
+        return 10, raw, "Excellent grammar."
+    elif 0.7 <= raw <= 0.89:
+        return 8, raw, "Good grammar."
+    elif 0.5 <= raw <= 0.69:
+        return 6, raw, "Fair grammar."
+    elif 0.3 <= raw <= 0.49:
+        return 4, raw, "Poor grammar."
+    else:
+        return 2, raw, "Very poor grammar."
+
+
+def compute_ttr_score(toks: Tokens) -> Tuple[int, float, str]:
+    # Plain type-token ratio; equivalent to LexicalRichness(text).ttr without
+    # the object construction and internal re-tokenization.
+    wl = toks.lower
+    total = len(wl) or 1
+    ttr = len(set(wl)) / total
+    if 0.9 <= ttr <= 1.0:
+        return 10, ttr, "Excellent lexical diversity."
+    elif 0.7 <= ttr <= 0.89:
+        return 8, ttr, "Good lexical diversity."
+    elif 0.5 <= ttr <= 0.69:
+        return 6, ttr, "Fair lexical diversity."
+    elif 0.3 <= ttr <= 0.49:
+        return 4, ttr, "Poor lexical diversity."
+    else:
+        return 2, ttr, "Very poor lexical diversity."
+
+def compute_filler_rate_score(toks: Tokens) -> Tuple[int, float, str]:
+    total = len(toks.lower) or 1
+    count = sum(1 for w in toks.lower if w in FILLER_SINGLES)
+    count += len(FILLER_PHRASE_RE.findall(toks.joined))
+    rate = (count / total) * 100.0
+    if 0 <= rate <= 3:
+        return 15, rate, "Clear"
+    elif rate <= 6:
+        return 11, rate, "Occasional filler words."
+    elif rate <= 10:
+        return 7, rate, "Frequent filler words."
+    else:
+        return 3, rate, "Excessive filler words."
+
+def batch_score(words_arr, filler_counts, durations, sentiment_compounds,
+                text_scores=None) -> Dict[str, np.ndarray]:
+    """Vectorized numeric scoring for bulk runs.
+
+    Takes per-transcript counts precomputed in Python (word counts, filler
+    counts, durations in seconds, VADER compounds) and buckets the
+    speech-rate, filler-rate and sentiment criteria for the whole batch in
+    one NumPy pass. ``text_scores`` is an optional array of the already
+    summed text-side criteria (salutation, keywords, flow, grammar,
+    vocabulary) folded into ``overall_score``.
+    """
+    words = np.asarray(words_arr, dtype=np.float64)
+    durs = np.asarray(durations, dtype=np.float64)
+    fillers = np.asarray(filler_counts, dtype=np.float64)
+    compounds = np.asarray(sentiment_compounds, dtype=np.float64)
+
+    wpm = np.where(durs > 0, words / np.where(durs > 0, durs, 1.0) * 60.0, 120.0)
+    rate_scores = np.select(
+        [wpm > 161, (wpm >= 141) & (wpm <= 160), (wpm >= 111) & (wpm <= 140),
+         (wpm >= 81) & (wpm <= 110)],
+        [2, 6, 10, 6], default=2)
+
+    rate = fillers / np.maximum(words, 1.0) * 100.0
+    filler_scores = np.select([rate <= 3, rate <= 6, rate <= 10], [15, 11, 7], default=3)
+
+    sentiment_scores = np.select(
+        [compounds >= 0.5, compounds >= 0.1, compounds >= -0.1], [15, 12, 8], default=4)
+
+    overall = (rate_scores + filler_scores + sentiment_scores).astype(np.float64)
+    if text_scores is not None:
+        overall = overall + np.asarray(text_scores, dtype=np.float64)
+    return {
+        "speech_rate": rate_scores,
+        "filler": filler_scores,
+        "sentiment": sentiment_scores,
+        "overall_score": overall,
+    }
+
+def _tokens_from_doc(text: str, doc) -> Tokens:
+    words = [t.text for t in doc if t.is_alpha]
+    lower = [w.lower() for w in words]
+    return Tokens(words=words, lower=lower, joined=" ".join(lower),
+                  sentences=tokenize_sentences(text), text_lower=text.lower())
+
+def score_batch(transcripts: List[str], durations: Optional[List[Optional[float]]] = None,
+                include_details: bool = True) -> List[dict]:
+    """Score many transcripts, amortizing per-call setup across the batch.
+
+    With spaCy installed, tokenization goes through nlp.pipe so the per-doc
+    overhead is batched; otherwise each transcript is tokenized with the
+    regex tokenizer. Either way the scorers reuse the process-wide
+    LanguageTool singleton and compiled patterns.
+    """
+    if durations is None:
+        durations = [None] * len(transcripts)
+    if SPACY_AVAILABLE:
+        docs = _get_nlp().pipe(transcripts, batch_size=64)
+        return [_score_with_tokens(t, d, _tokens_from_doc(t, doc), include_details)
+                for t, d, doc in zip(transcripts, durations, docs)]
+    return [_score_with_tokens(t, d, tokenize(t), include_details)
+            for t, d in zip(transcripts, durations)]
+
+_SIA = None
+
+def _get_sia():
+    # Lazy singleton: VADER builds its ~7500-entry lexicon on construction.
+    global _SIA
+    if _SIA is None:
+        _SIA = SentimentIntensityAnalyzer()
+    return _SIA
+
+# Small lexicons covering the tone vocabulary typical of self-introductions;
+# when a transcript is decisively one-sided on these alone, VADER is skipped.
+_FAST_POS = frozenset({
+    "happy", "love", "enjoy", "great", "good", "best", "favorite", "favourite",
+    "excited", "thrilled", "proud", "wonderful", "amazing", "awesome", "fun",
+    "glad", "nice", "passionate", "thank", "thanks", "won", "achievement", "dream"
+})
+_FAST_NEG = frozenset({
+    "sad", "hate", "bad", "worst", "angry", "upset", "afraid", "fear", "fail",
+    "failed", "terrible", "awful", "bored", "boring", "lonely", "sick", "tired",
+    "worried", "unhappy", "difficult", "problem", "trouble", "lose"
+})
+# Negation flips polarity in ways the bag-of-words counts cannot see
+# ("not happy"), so its presence always sends the text to the full VADER pass.
+# Tested against the raw lowered text rather than the token list so the guard
+# behaves the same under every tokenizer (the spaCy path drops contractions).
+_NEGATOR_RE = re.compile(r"\b(?:not|no|never|dont|cant|isnt|wont|didnt)\b|n't\b")
+
+def compute_sentiment_score(text: str, toks: Tokens) -> Tuple[int, float, str]:
+    compound = None
+    if not _NEGATOR_RE.search(toks.text_lower):
+        pos = sum(1 for w in toks.lower if w in _FAST_POS)
+        neg = sum(1 for w in toks.lower if w in _FAST_NEG)
+        if pos >= 2 and neg == 0:
+            compound = 0.6
+        elif neg >= 2 and pos == 0:
+            compound = -0.6
+    if compound is None:
+        compound = _get_sia().polarity_scores(text)["compound"]
+    if compound >= 0.5:
+        return 15, compound, "Very positive tone."
+    elif compound >= 0.1:
+        return 12, compound, "Positive tone."
+    elif compound >= -0.1:
+        return 8, compound, "Neutral tone."
+    else:
+        return 4, compound, "Negative tone."